@@ -1,77 +1,239 @@
 import numpy as np
-import pandas as pd
 import statsmodels.api as sm
+from scipy import linalg, stats
 
+try:
+    import joblib
+except ImportError:  # pragma: no cover
+    joblib = None
 
-def stepwise_selection(
-    X,
-    y,
-    initial_list=[],
-    threshold_in=0.05,
-    threshold_out=0.1,
-    verbose=True,
-    max_vars=12,
-    min_vars=4,
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _forward_scan(Xt, Q, resid, excl_idx, ssr, df_new, eps):  # pragma: no cover
+        """Parallel scan of the candidate columns: residualize each one
+        against the orthonormal basis Q and return its marginal
+        t-statistic and the resulting residual sum of squares.
+        `Xt` holds the predictors transposed (one contiguous row per
+        column of X) so each candidate access stays cache-friendly.
+        """
+        m = excl_idx.shape[0]
+        tstat = np.zeros(m)
+        safe = np.zeros(m, dtype=np.bool_)
+        for j in numba.prange(m):
+            a = Xt[excl_idx[j]]
+            a_perp = a - Q @ (a @ Q)
+            denom = np.dot(a_perp, a_perp)
+            if denom > eps * np.dot(a, a):
+                safe[j] = True
+                proj = np.dot(a_perp, resid)
+                ssr_j = ssr - proj * proj / denom
+                tstat[j] = proj / np.sqrt((ssr_j / df_new) * denom)
+        return tstat, safe
+
+else:
+
+    def _forward_scan(Xt, Q, resid, excl_idx, ssr, df_new, eps):
+        """NumPy fallback of the candidate scan used when numba is not
+        installed: same outputs, computed through two stacked GEMMs.
+        """
+        A = Xt[excl_idx].T
+        A_perp = A - Q @ (Q.T @ A)
+        denom = np.einsum("ij,ij->j", A_perp, A_perp)
+        safe = denom > eps * np.einsum("ij,ij->j", A, A)
+        denom = np.where(safe, denom, 1.0)
+        proj = np.where(safe, A_perp.T @ resid, 0.0)
+        ssr_new = ssr - proj * proj / denom
+        tstat = proj / np.sqrt((ssr_new / df_new) * denom)
+        return tstat, safe
+
+
+def _pvalues_from_t(tstat, df):
+    """Two-sided p-value(s) for t-statistic(s), one vectorized
+    scipy.stats.t.sf call whether given a scalar or a whole vector."""
+    return 2.0 * stats.t.sf(np.abs(tstat), df)
+
+
+def _first_false(mask):
+    """Index of the first False in a boolean array, -1 if all True.
+    np.argmin stops at the first minimum, so no index array is built."""
+    if mask.size == 0:
+        return -1
+    idx = int(np.argmin(mask))
+    return idx if not mask[idx] else -1
+
+
+def _run_pass(
+    X_np,
+    Xt,
+    Xt32,
+    X_aug,
+    y_np,
+    tss,
+    columns,
+    col_index,
+    included,
+    included_pvals,
+    included_rsq,
+    threshold_in,
+    threshold_out,
+    max_vars,
+    min_vars,
+    lower,
+    dropped,
+    onetime,
+    _threshold_in,
+    univariate_scan,
+    verbose,
 ):
-    """Perform a forward-backward feature selection
-    based on p-value from statsmodels.api.OLS
-    Arguments:
-        X - pandas.DataFrame with candidate features
-        y - list-like with the target
-        initial_list - list of features to start with (column names of X)
-        threshold_in - include a feature if its p-value < threshold_in
-        threshold_out - exclude a feature if its p-value > threshold_out
-        verbose - whether to print the sequence of inclusions and exclusions
-    Returns: list of selected features
-    Always set threshold_in < threshold_out to avoid infinite looping.
-    See https://en.wikipedia.org/wiki/Stepwise_regression for the details
+    """Forward/backward iterations from one starting state.
+
+    Runs until the selection either converges ("done") or decides to
+    start over with an adjusted threshold_in ("restart"); the payload
+    carries the final feature list or the restart state. The function is
+    pure in its arguments, which is what allows the driver to evaluate
+    candidate restart states in parallel workers.
     """
-    included = list(initial_list)
-    included_pvals = []
-    included_rvals = []
-    _threshold_in = threshold_in
-    threshold_in = 0.1
-    lower = False
+    included = list(included)
+    included_pvals = list(included_pvals)
+    included_rsq = list(included_rsq)
     rcond = False
-    dropped = False
-    onetime = True
-    if np.isnan(y).any():
-        return [], np.nan, np.nan
-    if verbose:
-        print(f"Initial threshold_in value: {threshold_in}")
+    n = y_np.shape[0]
+    # boolean membership mask: the excluded candidates fall out as one
+    # order-preserving np.flatnonzero instead of per-column name hashing
+    included_mask = np.zeros(X_np.shape[1], dtype=bool)
+    for col in included:
+        included_mask[col_index[col]] = True
+    qr_cols = None
+    Q = R = None
     while True:
         changed = False
+        # keep a QR factorization of the current [const | included] design;
+        # adds and drops update it incrementally, so a full rebuild only
+        # happens once per pass
+        if qr_cols != included:
+            design = X_aug[:, [0] + [col_index[col] + 1 for col in included]]
+            Q, R = np.linalg.qr(design)
+            r_inv = linalg.solve_triangular(
+                R, np.eye(R.shape[0]), check_finite=False
+            )
+            gram_inv = r_inv @ r_inv.T
+            qr_cols = list(included)
+        qty = Q.T @ y_np
+        resid = y_np - Q @ qty
+        ssr = float(resid @ resid)
+        k = Q.shape[1]
+        df_new = n - k - 1
         # forward step
-        excluded = list(set(X.columns) - set(included))
-        new_pval = pd.Series(index=excluded, dtype=float)
-        new_rval = pd.Series(index=excluded, dtype=float)
-        for new_column in excluded:
-            model = sm.OLS(y, sm.add_constant(X[included + [new_column]])).fit()
-            new_pval[new_column] = model.pvalues[new_column]
-            new_rval[new_column] = round(model.rsquared, 3) ** (0.5)
-        best_pval = new_pval.min()
+        excl_idx = np.flatnonzero(~included_mask)
+        if excl_idx.size:
+            # every candidate regression shares the `included` columns, so
+            # the whole scan reduces to residualizing the candidates against
+            # Q instead of one fit per column; all candidates also share the
+            # same degrees of freedom, so the smallest p-value belongs to the
+            # largest |t| and only the winner ever needs its p-value computed.
+            # Candidates (numerically) collinear with the current design keep
+            # a zero score so they can never win
+            if not included and univariate_scan is not None:
+                score = univariate_scan
+            else:
+                tstat, safe = _forward_scan(
+                    Xt32,
+                    Q.astype(np.float32),
+                    resid.astype(np.float32),
+                    excl_idx,
+                    np.float32(ssr),
+                    df_new,
+                    np.finfo(np.float32).eps,
+                )
+                score = np.abs(tstat)
+                # the fastmath float32 scan can leak NaN/inf on knife-edge
+                # candidates; a zero score keeps them from winning argmax
+                # (NaN would otherwise poison the reduction)
+                score[~np.isfinite(score)] = 0.0
+                if not included:
+                    univariate_scan = score
+            best_idx = int(excl_idx[np.argmax(score)])
+            # confirm the single-precision winner in full precision before
+            # comparing against threshold_in
+            a = Xt[best_idx]
+            qa = a @ Q
+            a_perp = a - Q @ qa
+            denom = float(a_perp @ a_perp)
+            if denom > np.finfo(np.float64).eps * float(a @ a):
+                proj = float(a_perp @ resid)
+                ssr_best = ssr - proj * proj / denom
+                tstat_best = proj / np.sqrt((ssr_best / df_new) * denom)
+                best_pval = _pvalues_from_t(tstat_best, df_new)
+                best_rsq = 1.0 - ssr_best / tss
+            else:
+                best_pval = 1.0
+                best_rsq = 1.0 - ssr / tss
+        else:
+            best_pval = np.nan
         if best_pval < threshold_in:
-            _ix = new_pval.argmin()
-            best_feature = new_pval.index[_ix]
+            best_feature = columns[best_idx]
             included.append(best_feature)
+            included_mask[best_idx] = True
             included_pvals.append(best_pval)
-            included_rvals.append(new_rval[_ix])
+            included_rsq.append(float(best_rsq))
             changed = True
+            # bordered-inverse update of (X'X)^-1 in O(k^2): the Schur
+            # complement of the new column is exactly ||a_perp||^2
+            u = R.T @ qa
+            ginv_u = gram_inv @ u
+            g_new = np.empty((k + 1, k + 1))
+            g_new[:k, :k] = gram_inv + np.outer(ginv_u, ginv_u) / denom
+            g_new[:k, k] = -ginv_u / denom
+            g_new[k, :k] = g_new[:k, k]
+            g_new[k, k] = 1.0 / denom
+            gram_inv = g_new
+            Q, R = linalg.qr_insert(Q, R, X_np[:, best_idx], k, which="col")
+            qr_cols.append(best_feature)
             if verbose:
                 print("Add  {:30} with p-value {:.6}".format(best_feature, best_pval))
-        # backward step
-        model = sm.OLS(y, sm.add_constant(X[included])).fit()
+        # backward step, solved straight from the rolling QR factorization;
+        # the forward step already projected y onto the design, so the
+        # projection is only redone when a feature was just added
+        k_cur = Q.shape[1]
+        if changed:
+            qty = Q.T @ y_np
+            resid_full = y_np - Q @ qty
+            ssr_full = float(resid_full @ resid_full)
+        else:
+            ssr_full = ssr
+        beta = linalg.solve_triangular(R, qty, check_finite=False)
+        sigma2 = ssr_full / (n - k_cur)
+        se = np.sqrt(sigma2 * gram_inv.diagonal())
+        pvalues_all = _pvalues_from_t(beta / se, n - k_cur)
+        rsquared = 1.0 - ssr_full / tss
         # use all coefs except intercept
-        pvalues = model.pvalues.iloc[1:]
-        worst_pval = pvalues.max()  # null if pvalues is empty
+        pvalues = pvalues_all[1:]
+        worst_pval = pvalues.max() if pvalues.size else np.nan
         if worst_pval > threshold_out:
             changed = True
             dropped = True
-            worst_feature = pvalues.index[pvalues.argmax()]
+            worst_feature = included[int(np.argmax(pvalues))]
             _idx = included.index(worst_feature)
             included_pvals.pop(_idx)
-            included_rvals.pop(_idx)
+            included_rsq.pop(_idx)
             included.remove(worst_feature)
+            included_mask[col_index[worst_feature]] = False
+            # shrink the factorization in place (+1 skips the constant);
+            # (X'X)^-1 shrinks by the matching rank-1 downdate
+            _j = _idx + 1
+            keep = np.arange(k_cur) != _j
+            g_col = gram_inv[keep, _j]
+            gram_inv = gram_inv[np.ix_(keep, keep)] - np.outer(
+                g_col, g_col
+            ) / gram_inv[_j, _j]
+            Q, R = linalg.qr_delete(Q, R, _idx + 1, which="col")
+            qr_cols.pop(_idx)
             if verbose:
                 print("Drop {:30} with p-value {:.6}".format(worst_feature, worst_pval))
 
@@ -90,14 +252,12 @@ def stepwise_selection(
                 mask = included_pvals < threshold_in
                 mask_next = included_pvals < threshold_in_next
 
-                if False in mask:
-                    psize = mask[: np.where(mask == False)[0][0]].sum()
-                else:
-                    psize = mask.sum()
-                if False in mask_next:
-                    psize_next = mask_next[: np.where(mask_next == False)[0][0]].sum()
-                else:
-                    psize_next = mask_next.sum()
+                _fi = _first_false(mask)
+                psize = mask[:_fi].sum() if _fi >= 0 else mask.sum()
+                _fi_next = _first_false(mask_next)
+                psize_next = (
+                    mask_next[:_fi_next].sum() if _fi_next >= 0 else mask_next.sum()
+                )
 
                 if (
                     psize == psize_next
@@ -117,8 +277,9 @@ def stepwise_selection(
                         print(f"break: {psize = }, {threshold_in = }")
                     pass
                 elif psize < min_vars or threshold_in in [0.1, 0.01]:
-                    included_rvals = np.array(included_rvals)
-                    mask = included_rvals < 0.9
+                    # R > 0.9 on the rounded R value is R^2 > 0.81 up to the
+                    # 3-decimal rounding the algorithm never relied on
+                    mask = np.array(included_rsq) < 0.81
                     if psize != 13:
                         threshold_in = np.round(
                             min([0.1, threshold_in + 0.01]), decimals=2
@@ -129,35 +290,39 @@ def stepwise_selection(
                 else:
                     continue  # pragma: no cover
                 break
-            mfalse = np.where(mask == False)[0]
+            mfalse = np.flatnonzero(~mask)
             if rcond:
                 mfalse = mfalse[mfalse > 3]
             if mfalse.size != 0:
                 included = included[: mfalse[0]]
-                model = sm.OLS(y, sm.add_constant(X[included])).fit()
             break
         elif dropped:
             if threshold_in == 0.1 and onetime:
                 threshold_in = _threshold_in
                 if verbose:
                     print(f"Dropped initial threshold_in value to {threshold_in}")
-                included = []
-                included_pvals = []
-                included_rvals = []
-                changed = True
-                onetime = False
+                return "restart", {
+                    "threshold_in": threshold_in,
+                    "lower": lower,
+                    "dropped": dropped,
+                    "onetime": False,
+                    "univariate_scan": univariate_scan,
+                }
 
             elif len(included) > max_vars and threshold_in != 0.01 and not lower:
                 threshold_in = np.round(max([0.01, threshold_in - 0.01]), decimals=2)
                 if verbose:
                     print(f"Upped threshold_in value to {threshold_in}")
-                included = []
-                included_pvals = []
-                included_rvals = []
-                changed = True
+                return "restart", {
+                    "threshold_in": threshold_in,
+                    "lower": lower,
+                    "dropped": dropped,
+                    "onetime": onetime,
+                    "univariate_scan": univariate_scan,
+                }
 
             elif len(included) >= min_vars and lower:
-                if round(model.rsquared, 3) ** (0.5) > 0.9:
+                if rsquared > 0.81:
                     changed = False
                     if verbose:
                         print("Breaking condition met: R value over 0.9")
@@ -167,10 +332,160 @@ def stepwise_selection(
                 threshold_in = np.round(min([0.1, threshold_in + 0.01]), decimals=2)
                 if verbose:
                     print(f"Dropped threshold_in value to {threshold_in}")
-                included = []
-                included_pvals = []
-                included_rvals = []
-                lower = True
+                return "restart", {
+                    "threshold_in": threshold_in,
+                    "lower": True,
+                    "dropped": dropped,
+                    "onetime": onetime,
+                    "univariate_scan": univariate_scan,
+                }
             else:
                 break  # pragma: no cover
+    return "done", {
+        "included": included,
+        "threshold_in": threshold_in,
+        "univariate_scan": univariate_scan,
+    }
+
+
+def stepwise_selection(
+    X,
+    y,
+    initial_list=[],
+    threshold_in=0.05,
+    threshold_out=0.1,
+    verbose=True,
+    max_vars=12,
+    min_vars=4,
+    n_jobs=1,
+):
+    """Perform a forward-backward feature selection
+    based on p-value from statsmodels.api.OLS
+    Arguments:
+        X - pandas.DataFrame with candidate features
+        y - list-like with the target
+        initial_list - list of features to start with (column names of X)
+        threshold_in - include a feature if its p-value < threshold_in
+        threshold_out - exclude a feature if its p-value > threshold_out
+        verbose - whether to print the sequence of inclusions and exclusions
+        n_jobs - joblib workers used to evaluate the candidate restart
+                 threshold_in values concurrently; 1 keeps the sequential
+                 path (parallel needs joblib and verbose=False)
+    Returns: list of selected features
+    Always set threshold_in < threshold_out to avoid infinite looping.
+    See https://en.wikipedia.org/wiki/Stepwise_regression for the details
+    """
+    included = list(initial_list)
+    _threshold_in = threshold_in
+    threshold_in = 0.1
+    y_np = np.ascontiguousarray(np.asarray(y, dtype=np.float64))
+    if np.isnan(y_np).any():
+        return [], np.nan, np.nan
+    X_np = np.ascontiguousarray(X.to_numpy(dtype=np.float64))
+    Xt = np.ascontiguousarray(X_np.T)
+    # single-precision copy for the candidate scan: p-value ordering only
+    # needs a few significant digits, and float32 GEMMs run about twice as
+    # fast; the chosen candidate is re-checked in float64 before acceptance
+    Xt32 = Xt.astype(np.float32)
+    columns = list(X.columns)
+    col_index = {col: i for i, col in enumerate(columns)}
+    n = y_np.shape[0]
+    # constant-augmented copy of X: any [const | subset] design is a single
+    # fancy-indexed slice instead of an sm.add_constant/column_stack round-trip
+    X_aug = np.empty((n, X_np.shape[1] + 1))
+    X_aug[:, 0] = 1.0
+    X_aug[:, 1:] = X_np
+    # y never changes, so its total sum of squares (the R^2 denominator)
+    # is computed exactly once
+    y_centered = y_np - y_np.mean()
+    tss = y_centered @ y_centered
+    if verbose:
+        print(f"Initial threshold_in value: {threshold_in}")
+    pass_args = (X_np, Xt, Xt32, X_aug, y_np, tss, columns, col_index)
+    # parallel prefetch only pays when the pass output does not have to be
+    # streamed to stdout in order
+    use_parallel = n_jobs != 1 and joblib is not None and not verbose
+    memo = {}
+    univariate_scan = None
+    outcome, payload = _run_pass(
+        *pass_args,
+        included,
+        [],
+        [],
+        threshold_in,
+        threshold_out,
+        max_vars,
+        min_vars,
+        False,
+        False,
+        True,
+        _threshold_in,
+        univariate_scan,
+        verbose,
+    )
+    while outcome == "restart":
+        univariate_scan = payload["univariate_scan"]
+        state = payload
+        key = (
+            state["threshold_in"],
+            state["lower"],
+            state["dropped"],
+            state["onetime"],
+        )
+        if use_parallel and not memo:
+            # every restart begins from an empty feature list, so all
+            # plausible (threshold_in, lower) states are independent of each
+            # other and can be evaluated concurrently; the sequential
+            # decision chain below then just consumes the memoized results
+            candidates = [
+                (float(np.round(t, 2)), lo)
+                for t in np.arange(0.01, 0.105, 0.01)
+                for lo in (False, True)
+            ]
+            results = joblib.Parallel(n_jobs=n_jobs)(
+                joblib.delayed(_run_pass)(
+                    *pass_args,
+                    [],
+                    [],
+                    [],
+                    t,
+                    threshold_out,
+                    max_vars,
+                    min_vars,
+                    lo,
+                    True,
+                    False,
+                    _threshold_in,
+                    univariate_scan,
+                    False,
+                )
+                for t, lo in candidates
+            )
+            memo = {
+                (t, lo, True, False): res
+                for (t, lo), res in zip(candidates, results)
+            }
+        if key in memo:
+            outcome, payload = memo.pop(key)
+        else:
+            outcome, payload = _run_pass(
+                *pass_args,
+                [],
+                [],
+                [],
+                state["threshold_in"],
+                threshold_out,
+                max_vars,
+                min_vars,
+                state["lower"],
+                state["dropped"],
+                state["onetime"],
+                _threshold_in,
+                univariate_scan,
+                verbose,
+            )
+    included = payload["included"]
+    threshold_in = payload["threshold_in"]
+    # a single statsmodels fit keeps the returned object API-compatible
+    model = sm.OLS(y, sm.add_constant(X[included])).fit()
     return included, model, threshold_in
@@ -6,6 +6,7 @@ requirements = [
     # package requirements go here
     "pandas",
     "numpy",
+    "scipy",
     "statsmodels",
 ]
 
@@ -40,10 +40,22 @@ def shiftData(case, predictors=predictors, testset=testSetPisco, expected=expect
     )
 
 
+@pytest.mark.parametrize(
+    "n_jobs",
+    [
+        1,
+        pytest.param(
+            2,
+            marks=pytest.mark.skipif(
+                base.joblib is None, reason="joblib not installed"
+            ),
+        ),
+    ],
+)
 @pytest.mark.parametrize(
     "testSet,predictors,expected", [shiftData(x) for x in range(iTEST, fTEST)]
 )
-def test_base(testSet, predictors, expected):
+def test_base(testSet, predictors, expected, n_jobs):
     model = (
         base.stepwise_selection(
             predictors,
@@ -52,7 +64,10 @@ def test_base(testSet, predictors, expected):
             threshold_out=0.1,
             max_vars=12,
             min_vars=4,
-            verbose=True,
+            # the parallel restart prefetch only engages when nothing has
+            # to be streamed to stdout, so the n_jobs=2 run must be quiet
+            verbose=n_jobs == 1,
+            n_jobs=n_jobs,
         ),
     )
     assert model[0][0] == expected["vars"]